@@ -1,9 +1,70 @@
-import json
 import copy
+import dis
+import functools
+import inspect
+import logging
+import operator
+import sys
 import traceback
-import weakref
 from contextlib import contextmanager
-from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Generator
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union, Generator
+
+
+_logger = logging.getLogger(__name__)
+
+# sentinel for "key did not exist" (distinct from a stored None)
+_MISSING = object()
+
+# immutable scalar types whose equal values are interchangeable
+_SCALAR_TYPES = frozenset({int, float, complex, str, bytes, bool, type(None)})
+
+
+@functools.lru_cache(maxsize=4096)
+def _valid_identifier(key: str) -> bool:
+	"""Memoized str.isidentifier(); field names repeat heavily across instances."""
+	return key.isidentifier()
+
+
+@functools.lru_cache(maxsize=1024)
+def _split_path(path: str) -> Tuple[str, ...]:
+	"""
+	Splits a dotted path into its parts (memoized for hot, repeated paths).
+	
+	Parts are interned so attribute lookups along the path compare by identity.
+	"""
+	return tuple(sys.intern(p) for p in path.split("."))
+
+
+def _attr_chain(fn: Callable[..., Any]) -> Optional[str]:
+	"""
+	Detects trivial accessor functions such as `lambda d: d.x.y`.
+	
+	Returns:
+		The dotted attribute chain ("x.y") if fn only loads attributes off its
+		single argument, otherwise None.
+	"""
+	# plain functions only: a bound method's __code__ still counts its self
+	# argument, so its first parameter is not the one the View passes in
+	if not inspect.isfunction(fn):
+		return None
+	code = fn.__code__
+	if code.co_argcount != 1 or code.co_kwonlyargcount:
+		return None
+	if code.co_flags & (inspect.CO_VARARGS | inspect.CO_VARKEYWORDS):
+		return None
+	
+	ops = [i for i in dis.get_instructions(code) if i.opname not in ("RESUME", "NOP", "CACHE")]
+	if len(ops) < 3 or ops[-1].opname != "RETURN_VALUE":
+		return None
+	if ops[0].opname not in ("LOAD_FAST", "LOAD_FAST_BORROW") or ops[0].arg != 0:
+		return None
+	
+	chain = []
+	for ins in ops[1:-1]:
+		if ins.opname != "LOAD_ATTR" or not isinstance(ins.argval, str):
+			return None
+		chain.append(ins.argval)
+	return ".".join(chain)
 
 
 class DataError(Exception):
@@ -17,13 +78,21 @@ class ComputationError(DataError):
 	Attributes:
 		key (str): The name of the field that failed to compute.
 		orig_exc (Exception): The original exception raised.
-		traceback (str): The formatted traceback string.
+		traceback (str): The formatted traceback string, built on first access.
 	"""
-	def __init__(self, key: str, orig_exc: Exception, tb: str):
+	def __init__(self, key: str, orig_exc: Exception, tb: Optional[str] = None):
 		super().__init__(f"Computation for '{key}' failed: {orig_exc}")
 		self.key = key
 		self.orig_exc = orig_exc
-		self.traceback = tb
+		self._tb = tb
+	
+	@property
+	def traceback(self) -> str:
+		"""Formats the original exception's traceback (cached after the first call)."""
+		if self._tb is None:
+			exc = self.orig_exc
+			self._tb = "".join(traceback.format_exception(type(exc), exc, exc.__traceback__))
+		return self._tb
 
 class TransactionError(DataError):
 	"""Raised when a transaction fails to rollback cleanly."""
@@ -42,6 +111,8 @@ class Method:
 	"""
 	Wraps a function to be bound to a Data instance at runtime.
 	"""
+	__slots__ = ('fn',)
+	
 	def __init__(self, fn: Callable[..., Any]):
 		"""
 		Initializes the Method wrapper.
@@ -71,14 +142,15 @@ class Method:
 			try:
 				return self.fn(data, *args, **kwargs)
 			except Exception as e:
-				tb = traceback.format_exc()
-				raise ComputationError(name, e, tb) from e
+				raise ComputationError(name, e) from e
 		return bound
 
 class Computed:
 	"""
 	Represents a value that is calculated once during Data initialization.
 	"""
+	__slots__ = ('fn',)
+	
 	def __init__(self, fn: Callable[["Data"], Any]):
 		"""
 		Initializes the Computed field.
@@ -107,14 +179,17 @@ class Computed:
 		try:
 			return self.fn(data)
 		except Exception as e:
-			tb = traceback.format_exc()
-			print(f"Computed failed for key {key}")
-			raise ComputationError(key, e, tb) from e
+			raise ComputationError(key, e) from e
 
 class Lazy:
 	"""
 	Represents a value that is computed only when first accessed and then cached.
+	
+	The cached value lives in the owning Data instance's __dict__ (see
+	Data.__getattr__), so Lazy itself holds no per-instance state.
 	"""
+	__slots__ = ('fn',)
+	
 	def __init__(self, fn: Callable[["Data"], Any]):
 		"""
 		Initializes the Lazy field.
@@ -128,53 +203,64 @@ class Lazy:
 		if not callable(fn):
 			raise TypeError("Lazy expects a callable")
 		self.fn = fn
-		self._cache = weakref.WeakKeyDictionary()
 	
 	def get(self, data: "Data", key: str = "<lazy>") -> Any:
 		"""
-		Retrieves the cached value or computes it if missing.
+		Computes the value for a Data instance.
 		
 		Args:
-			data: The Data instance acting as the cache key.
+			data: The Data instance to provide to the function.
 			key: The name of the field for error reporting.
 		
 		Returns:
-			The cached or newly computed value.
+			The newly computed value.
 		"""
-		if data not in self._cache:
-			try:
-				self._cache[data] = self.fn(data)
-			except Exception as e:
-				tb = traceback.format_exc()
-				raise ComputationError(key, e, tb) from e
-		return self._cache[data]
+		try:
+			return self.fn(data)
+		except Exception as e:
+			raise ComputationError(key, e) from e
 	
-	def invalidate(self, data=None) -> None:
+	def invalidate(self, data: "Data") -> None:
 		"""
-		Clears the cache for a specific Data instance or all instances.
+		Clears the value cached for this field on a specific Data instance.
 		
 		Args:
-			data: The specific Data instance to invalidate. If None, clears all.
+			data: The Data instance to invalidate.
 		"""
-		if data is None:
-			self._cache.clear()
-		else:
-			self._cache.pop(data, None)
+		for name, lazy in data._Data__lazy_fields.items():
+			if lazy is self and name in data.__dict__:
+				delattr(data, name)
+				data._Data__computed_lazy.discard(name)
 
 class View:
 	"""
 	A read-only dynamic view into a Data instance.
 	"""
+	__slots__ = ('_source', '_mapping')
+	
 	def __init__(self, source: "Data", mapping: Dict[str, Callable[["Data"], Any]]):
 		"""
 		Initializes the View.
 		
+		The mapping is copied, so its keys are fixed once the View is created.
+		
 		Args:
 			source: The Data instance to observe.
 			mapping: A dictionary mapping attribute names to access functions.
+		
+		Raises:
+			TypeError: If a mapping value is not callable.
 		"""
 		self._source = source
-		self._mapping = mapping
+		self._mapping = dict(mapping)
+		
+		for name, fn in self._mapping.items():
+			if not callable(fn):
+				raise TypeError(f"View mapping value for '{name}' is not callable")
+			# plain accessors (lambda d: d.x.y) run as a C-level attrgetter instead
+			chain = _attr_chain(fn)
+			if chain:
+				self._mapping[name] = operator.attrgetter(chain)
 	
 	def __getattr__(self, name: str) -> Any:
 		"""
@@ -190,20 +276,22 @@ class View:
 			AttributeError: If name is not in mapping.
 			ComputationError: If the mapping function fails.
 		"""
-		if name in self._mapping:
-			fn = self._mapping[name]
-			if not callable(fn):
-				raise ComputationError(name, TypeError("view mapping value is not callable"), traceback.format_stack())
-			try:
-				return fn(self._source)
-			except ComputationError:
-				# already wrapped - re-raise
-				raise
-			except Exception as e:
-				tb = traceback.format_exc()
-				print(f"View computation failed for {name}")
-				raise ComputationError(name, e, tb) from e
-		raise AttributeError(name)
+		# fail fast on misses; dunder probes (hasattr, copy, pickle) never map to
+		# view fields and must not touch instance state that may not exist yet
+		if name.startswith("__") and name.endswith("__"):
+			raise AttributeError(name)
+		# values are validated as callable at init, so None only means a miss
+		fn = self._mapping.get(name)
+		if fn is None:
+			raise AttributeError(name)
+		
+		try:
+			return fn(self._source)
+		except ComputationError:
+			# already wrapped - re-raise
+			raise
+		except Exception as e:
+			raise ComputationError(name, e) from e
 	
 	def __repr__(self) -> str:
 		return f"<View {list(self._mapping)}>"
@@ -213,6 +301,8 @@ class AntiFreeze:
 	"""
 	A wrapper used to mark specific fields to remain mutable even if the Data object is frozen.
 	"""
+	__slots__ = ('value',)
+	
 	def __init__(self, value: Any):
 		self.value = value
 	
@@ -223,25 +313,89 @@ class AntiFreeze:
 	def __repr__(self) -> str:
 		return f"AntiFreeze({self.value!r})"
 
+class _Registration:
+	"""
+	Journal entry for a Method or Lazy name overwritten inside a transaction,
+	so rollback can re-register it rather than just restore a field value.
+	"""
+	__slots__ = ('value',)
+	
+	def __init__(self, value: Union[Method, Lazy]):
+		self.value = value
+
 class FrozenDict(dict):
 	"""
 	A dictionary subclass that prevents modification.
+	
+	Lookups use dict's own C slots; the instance carries no __dict__ of its own,
+	only a slot for its structural hash, which is computed on first use.
 	"""
+	__slots__ = ('__hash',)
+	
 	def __readonly(self, *a, **k) -> None:
 		raise TypeError("FrozenDict is immutable")
 	
 	__setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = __readonly
+	
+	def __hash__(self) -> int:
+		"""Computes (once) a structural hash consistent with Data's."""
+		try:
+			return self.__hash
+		except AttributeError:
+			pass
+		h = _hash_mapping(self, set())
+		self.__hash = h
+		return h
+	
+	def __deepcopy__(self, memo: Dict[int, Any]) -> "FrozenDict":
+		"""
+		Shares the instance when no value below it is mutable; otherwise copies
+		the values (a FrozenDict only blocks writes to its own keys).
+		"""
+		if _deeply_immutable(self):
+			return self
+		items = [(k, _clone_value(x, memo)) for k, x in self.items()]
+		# a FrozenDict reached again through its own values was already copied there
+		if id(self) in memo:
+			return memo[id(self)]
+		new = memo[id(self)] = FrozenDict(items)
+		return new
+
+# exact types freeze() can return unchanged without inspecting them
+_IMMUTABLE_TYPES = _SCALAR_TYPES | {tuple, frozenset}
+
+def _deeply_immutable(v: Any) -> bool:
+	"""True if nothing reachable from v can be mutated, so copies may share it."""
+	t = type(v)
+	if t in _SCALAR_TYPES:
+		return True
+	if t is tuple or t is frozenset:
+		return all(_deeply_immutable(i) for i in v)
+	if t is FrozenDict:
+		return all(_deeply_immutable(i) for i in v.values())
+	if isinstance(v, Data):
+		return v._Data__deep_frozen
+	return False
 
 
 class Data:
 	"""
 	A robust data container supporting reactivity, freezing, transactions, and path-based access.
 	
+	Internal state lives in slots, so the instance __dict__ holds only user fields
+	(plus cached Lazy values).
+	
 	Attributes:
 		__frozen (bool): Whether the object is immutable.
-		__watchers (List[Callable]): Functions called on attribute changes.
+		__watchers (Tuple[Callable, ...]): Functions called on attribute changes.
 	"""
-	__slots__ = ('__dict__', '__weakref__')
+	__slots__ = (
+		'__dict__', '__weakref__',
+		'__frozen', '__watchers', '__lazy_fields', '__transaction_stack',
+		'__anti_freeze_fields', '__methods', '__non_fields', '__hash',
+		'__has_containers', '__visiting', '__batch_depth', '__pending_changes',
+		'__computed_lazy', '__deep_frozen',
+	)
 	
 	def __init__(self, **kwargs: Any):
 		"""
@@ -256,17 +410,14 @@ class Data:
 		Raises:
 			DataError: If a key is not a valid Python identifier.
 		"""
-		super().__setattr__("_Data__frozen", False)
-		super().__setattr__("_Data__watchers", [])
-		super().__setattr__("_Data__lazy_fields", {})
-		super().__setattr__("_Data__transaction_stack", [])
-		super().__setattr__("_Data__anti_freeze_fields", set())
-		super().__setattr__("_Data__methods", {})
+		self._init_state()
 		
 		# assign with validation
 		for k, v in kwargs.items():
-			if not isinstance(k, str) or not k.isidentifier():
+			if type(k) is not str or not _valid_identifier(k):
 				raise DataError(f"Invalid key: {k!r} (must be a valid identifier)")
+			# keys built at runtime (e.g. Data(**loaded)) are not interned by default
+			k = sys.intern(k)
 			
 			# AntiFreeze marker (unwrap immediately)
 			if isinstance(v, AntiFreeze):
@@ -276,10 +427,13 @@ class Data:
 			super().__setattr__(k, v)
 		
 		# compute Computed, register Lazy and Method
+		non_fields = self.__non_fields
 		for k, v in list(self.__dict__.items()):
 			if isinstance(v, Method):
+				# bound once and stored, so calls are plain attribute reads
 				self.__methods[k] = v
-				super().__setattr__(k, None)
+				non_fields.add(k)
+				super().__setattr__(k, v.bind(self, k))
 			
 			elif isinstance(v, Computed):
 				val = v.compute(self, key=k)
@@ -292,32 +446,74 @@ class Data:
 				super().__setattr__(k, val)
 			
 			elif isinstance(v, Lazy):
+				# computed and cached into __dict__ on first access
 				self.__lazy_fields[k] = v
-				super().__setattr__(k, None)
+				non_fields.add(k)
+				del self.__dict__[k]
+		
+		# sticky: once any non-scalar is stored, to_dict takes the general path
+		scalars = _SCALAR_TYPES
+		super().__setattr__(
+			"_Data__has_containers",
+			any(type(v) not in scalars for k, v in self.__dict__.items() if k not in non_fields),
+		)
 	
-	# 1. Access & Mutation
+	def _init_state(self) -> None:
+		"""Sets every internal slot to its empty-instance default (the one place they are listed)."""
+		setslot = object.__setattr__
+		setslot(self, "_Data__frozen", False)
+		setslot(self, "_Data__watchers", ())
+		setslot(self, "_Data__lazy_fields", {})
+		setslot(self, "_Data__computed_lazy", set())
+		setslot(self, "_Data__transaction_stack", [])
+		setslot(self, "_Data__anti_freeze_fields", set())
+		setslot(self, "_Data__methods", {})
+		# names in __dict__ that are not fields: bound Methods and cached Lazy values
+		setslot(self, "_Data__non_fields", set())
+		setslot(self, "_Data__hash", None)
+		setslot(self, "_Data__has_containers", False)
+		setslot(self, "_Data__visiting", False)
+		setslot(self, "_Data__batch_depth", 0)
+		setslot(self, "_Data__pending_changes", {})
+		# set by freeze() when no field can be mutated at any depth
+		setslot(self, "_Data__deep_frozen", False)
 	
-	def __getattribute__(self, name: str) -> Any:
+	@classmethod
+	def _bare(cls) -> "Data":
 		"""
-		Custom attribute access to resolve Methods and Lazy fields.
+		Creates an empty instance without running __init__.
+		
+		For internal nodes (e.g. intermediate Data created by set()) that have no
+		kwargs to validate or process.
 		"""
-		d = object.__getattribute__(self, "__dict__")
+		obj = cls.__new__(cls)
+		obj._init_state()
+		return obj
+	
+	# 1. Access & Mutation
+	
+	def __getattr__(self, name: str) -> Any:
+		"""
+		Resolves Lazy fields. Only called when normal lookup misses, so plain
+		fields and (pre-bound) Methods are read without any Python-level overhead.
 		
-		methods = d.get("_Data__methods", {})
-		if name in methods:
-			return methods[name].bind(self, name)
+		A computed Lazy value is cached in the instance __dict__ until the next
+		invalidation.
+		"""
+		# an unset internal slot (mid copy/unpickle) must not recurse back in here
+		if name in _INTERNAL_KEYS:
+			raise AttributeError(name)
 		
-		lazy = d.get("_Data__lazy_fields", {})
+		lazy = self.__lazy_fields
 		if name in lazy:
-			try:
-				return lazy[name].get(self, key=name)
-			except ComputationError:
-				raise
-			except Exception as e:
-				tb = traceback.format_exc()
-				raise ComputationError(name, e, tb) from e
-		
-		return object.__getattribute__(self, name)
+			# Lazy.get wraps failures in ComputationError itself
+			val = lazy[name].get(self, key=name)
+			# cached only: to_dict/diff/freeze skip lazy names
+			self.__dict__[name] = val
+			self.__computed_lazy.add(name)
+			return val
+		
+		raise AttributeError(f"'Data' object has no attribute {name!r}")
 	
 	def __setattr__(self, key: str, value: Any) -> None:
 		"""
@@ -329,46 +525,159 @@ class Data:
 		
 		Raises:
 			AttributeError: If the Data instance is frozen.
-			DataError: If the key is not a valid identifier.
+			DataError: If the key is internal or not a valid identifier.
+		"""
+		self._check_key(key)
+		old = self._write(key, value)
+		if old is _MISSING:
+			return
+		
+		# skip the call entirely unless some Lazy value is actually cached
+		if self.__computed_lazy:
+			self._invalidate_lazy()
+		
+		# _notify isolates watcher failures itself
+		if self.__watchers:
+			self._notify(key, old, value)
+	
+	def _check_key(self, key: str) -> None:
+		"""
+		Raises unless key may be assigned as a field.
+		
+		Raises:
+			AttributeError: If the Data instance is frozen.
+			DataError: If the key is internal or not a valid identifier.
 		"""
 		if self.__frozen and key not in self.__anti_freeze_fields:
 			raise AttributeError(f"Data is frozen (cannot modify '{key}')")
-		
-		if not isinstance(key, str) or not key.isidentifier():
+		if key in _INTERNAL_KEYS:
 			raise DataError(f"Invalid attribute name: {key!r}")
+		# a key already in __dict__ was validated when it was first stored
+		if key not in self.__dict__ and (type(key) is not str or not _valid_identifier(key)):
+			raise DataError(f"Invalid attribute name: {key!r}")
+	
+	def _write(self, key: str, value: Any) -> Any:
+		"""
+		Stores one checked field value: journals it, resets the hash and records
+		containers. The single write path shared by __setattr__ and update().
 		
+		Returns:
+			The previous value (None for a new key), or _MISSING when the caller has
+			nothing left to do: an equal scalar was re-asserted, or invalidation and
+			notification were deferred to an enclosing batch_updates().
+		"""
+		stack = self.__transaction_stack
+		
+		# assigning over a Method or Lazy name turns it back into a plain field
+		non_fields = self.__non_fields
+		if non_fields and key in non_fields:
+			registered = self._detach(key)
+			if stack:
+				stack[-1].setdefault(key, _Registration(registered))
+		
+		d = self.__dict__
+		old = d.get(key, _MISSING)
+		# re-asserting an equal scalar changes nothing: skip invalidation and watchers
+		if type(old) is type(value) and type(value) in _SCALAR_TYPES and old == value:
+			d[key] = value
+			return _MISSING
+		
+		# journal the pre-transaction value on first write
+		if stack:
+			stack[-1].setdefault(key, old)
+		
+		if old is _MISSING:
+			# keys built at runtime (e.g. setattr, update(**loaded)) are not interned
+			key = sys.intern(key)
+			old = None
+		
+		d[key] = value
+		setslot = object.__setattr__
+		if type(value) not in _SCALAR_TYPES:
+			setslot(self, "_Data__has_containers", True)
 		if not self.__frozen:
-			super().__setattr__("_Data__hash", None)
+			setslot(self, "_Data__hash", None)
 		
-		old = self.__dict__.get(key, None)
-		super().__setattr__(key, value)
+		# inside batch_updates(): invalidation and notification wait for the flush
+		if self.__batch_depth:
+			self.__pending_changes.setdefault(key, old)
+			return _MISSING
+		return old
+	
+	def _invalidate_lazy(self) -> None:
+		"""Drops cached Lazy values so they are recomputed on next access."""
+		d = self.__dict__
+		computed = self.__computed_lazy
+		for name in computed:
+			d.pop(name, None)
+		computed.clear()
+	
+	def _detach(self, name: str) -> Union[Method, Lazy]:
+		"""
+		Unregisters a Method or Lazy name so it can be stored as a plain field.
+		The bound method or cached value is dropped, so the write sees no old value.
 		
-		try:
-			for lazy in self.__lazy_fields.values():
-				lazy.invalidate()
-		except Exception:
-			print(f"Failed to invalidate lazy fields after setting {key}")
+		Returns:
+			The Method or Lazy that was registered under name.
+		"""
+		registered = self.__methods.pop(name, None)
+		if registered is None:
+			registered = self.__lazy_fields.pop(name)
+		self.__non_fields.discard(name)
+		self.__computed_lazy.discard(name)
+		self.__dict__.pop(name, None)
+		return registered
+	
+	def _reattach(self, name: str, registered: Union[Method, Lazy]) -> None:
+		"""Re-registers a Method or Lazy removed by _detach (transaction rollback)."""
+		self.__non_fields.add(name)
+		if isinstance(registered, Method):
+			self.__methods[name] = registered
+			self.__dict__[name] = registered.bind(self, name)
+		else:
+			# recomputed on next access, like any invalidated Lazy
+			self.__lazy_fields[name] = registered
+			self.__dict__.pop(name, None)
+	
+	@staticmethod
+	def compile_path(path: str) -> Tuple[str, ...]:
+		"""
+		Pre-splits a dotted path for repeated use with get() and set().
 		
-		try:
-			self._notify(key, old, value)
-		except Exception:
-			print(f"Failed to notify watchers after setting {key}")
+		Usage:
+			name = Data.compile_path("user.profile.name")
+			data.get(name)
+		
+		Raises:
+			PathError: If the path is not a non-empty string.
+		"""
+		if not isinstance(path, str) or path == "":
+			raise PathError("path must be a non-empty string")
+		return _split_path(path)
 	
-	def get(self, path: str, default: Any = None) -> Any:
+	def get(self, path: Union[str, Tuple[str, ...]], default: Any = None) -> Any:
 		"""
 		Retrieves a nested value using dot-notation (e.g., 'user.profile.name').
 		
 		Args:
-			path: Dot-separated string of keys/attributes.
+			path: Dot-separated string of keys/attributes, or a tuple from compile_path().
 			default: Value to return if path is not found.
 		
 		Returns:
 			The value at the path or the default.
 		"""
-		if not isinstance(path, str) or path == "":
-			raise PathError("path must be a non-empty string")
+		if type(path) is tuple:
+			if not path:
+				raise PathError("path must not be empty")
+			parts = path
+		else:
+			if not isinstance(path, str) or path == "":
+				raise PathError("path must be a non-empty string")
+			if "." not in path:
+				return getattr(self, path, default)
+			parts = _split_path(path)
 		cur: Any = self
-		for part in path.split("."):
+		for part in parts:
 			if isinstance(cur, Data):
 				# use getattr with default so missing attr returns default
 				cur = getattr(cur, part, default)
@@ -379,25 +688,33 @@ class Data:
 				return default
 		return cur
 	
-	def set(self, path: str, value: Any) -> None:
+	def set(self, path: Union[str, Tuple[str, ...]], value: Any) -> None:
 		"""
 		Sets a nested value using dot-notation, creating intermediate Data objects if needed.
 		
 		Args:
-			path: Dot-separated string of keys/attributes.
+			path: Dot-separated string of keys/attributes, or a tuple from compile_path().
 			value: The value to set at the end of the path.
 		
 		Raises:
 			PathError: If the path is invalid or cannot be traversed.
 		"""
-		if not isinstance(path, str) or path == "":
-			raise PathError("path must be a non-empty string")
-		parts = path.split(".")
+		if type(path) is tuple:
+			if not path:
+				raise PathError("path must not be empty")
+			parts = path
+		else:
+			if not isinstance(path, str) or path == "":
+				raise PathError("path must be a non-empty string")
+			if "." not in path:
+				setattr(self, path, value)
+				return
+			parts = _split_path(path)
 		cur: Any = self
 		for p in parts[:-1]:
 			n = getattr(cur, p, None) if isinstance(cur, Data) else (cur.get(p) if isinstance(cur, dict) else None)
 			if n is None:
-				n = Data()
+				n = Data._bare()
 				if isinstance(cur, Data):
 					setattr(cur, p, n)
 				elif isinstance(cur, dict):
@@ -413,6 +730,41 @@ class Data:
 		else:
 			raise PathError(f"Cannot set path {path!r} (parent is {type(cur).__name__})")
 	
+	def update(self, **kwargs: Any) -> None:
+		"""
+		Sets several fields at once.
+		
+		Equivalent to assigning each key in turn, except that lazy fields are
+		invalidated once for the whole batch and watchers are notified after all
+		values are written. All keys are validated before anything is written.
+		
+		Args:
+			**kwargs: Key-value pairs to assign.
+		
+		Raises:
+			AttributeError: If the Data instance is frozen.
+			DataError: If a key is not a valid identifier.
+		"""
+		# check every key first, so a bad one leaves nothing written
+		check = self._check_key
+		for k in kwargs:
+			check(k)
+		
+		write = self._write
+		changes: List[Tuple[str, Any, Any]] = []
+		for k, v in kwargs.items():
+			old = write(k, v)
+			if old is not _MISSING:
+				changes.append((k, old, v))
+		
+		if not changes:
+			return
+		if self.__computed_lazy:
+			self._invalidate_lazy()
+		if self.__watchers:
+			for k, old, new in changes:
+				self._notify(k, old, new)
+	
 	# 2. Decorators
 	
 	def method(self, fn: Callable[..., Any]) -> Callable[..., Any]:
@@ -434,10 +786,11 @@ class Data:
 		if hasattr(type(self), name):
 			raise AttributeError(f"Cannot add method '{name}': name is reserved by Data")
 		
-		self._Data__methods[name] = Method(fn)
-		
-		if name in self.__dict__:
-			del self.__dict__[name]
+		m = self.__methods[name] = Method(fn)
+		if self.__lazy_fields.pop(name, None) is not None:
+			self.__computed_lazy.discard(name)
+		self.__non_fields.add(name)
+		self.__dict__[name] = m.bind(self, name)
 		
 		return fn
 	
@@ -471,7 +824,13 @@ class Data:
 			self.__anti_freeze_fields.add(name)
 			val = val.unwrap()
 		
+		# a Computed over a Method or Lazy name replaces it as a plain field
+		if name in self.__non_fields:
+			self._detach(name)
+		
 		super().__setattr__(name, val)
+		if type(val) not in _SCALAR_TYPES:
+			super().__setattr__("_Data__has_containers", True)
 		
 		return val
 	
@@ -496,20 +855,27 @@ class Data:
 		
 		lz = Lazy(fn)
 		self.__lazy_fields[name] = lz
+		self.__methods.pop(name, None)
+		self.__non_fields.add(name)
 		
 		if name in self.__dict__:
 			del self.__dict__[name]
+		self.__computed_lazy.discard(name)
 		
 		return lz
 	
 	# 3. State Control
 	
-	def freeze(self) -> "Data":
+	def freeze(self, _seen: Optional[Dict[int, Tuple[Any, Any]]] = None) -> "Data":
 		"""
 		Recursively converts the Data object and its contents into immutable types.
 		
 		Dictionaries become FrozenDicts, lists become tuples, and sets become frozensets.
-		Fields marked with AntiFreeze remain mutable.
+		Fields marked with AntiFreeze remain mutable. Already-frozen values are kept
+		as-is, and containers shared within the tree are only converted once.
+		
+		Args:
+			_seen: Internal memo of converted containers (id -> (original, frozen)).
 		
 		Returns:
 			The current Data instance (frozen).
@@ -517,81 +883,161 @@ class Data:
 		Raises:
 			DataError: If freezing a specific key fails.
 		"""
+		if self.__frozen:
+			return self
+		if _seen is None:
+			_seen = {}
+		# registered up front so reference cycles back to self terminate
+		_seen[id(self)] = (self, self)
+		
+		# bound once as closure locals rather than looked up per visited value
+		_isinstance = isinstance
+		_Data, _dict, _list, _set = Data, dict, list, set
+		immutable = _IMMUTABLE_TYPES
+		frozen_types = (tuple, frozenset)
+		seen_get = _seen.get
+		
 		def _freeze(v):
-			if isinstance(v, Data):
-				v.freeze()
+			# exact-type check first: scalar leaves dominate most trees
+			if type(v) in immutable:
+				return v
+			if _isinstance(v, frozen_types):
+				return v
+			# frozen sub-Data (e.g. shared from another tree): no call, no memo entry
+			if type(v) is _Data and v._Data__frozen:
+				return v
+			entry = seen_get(id(v))
+			if entry is not None:
+				return entry[1]
+			if _isinstance(v, _Data):
+				return v.freeze(_seen)
+			if _isinstance(v, _dict):
+				out = FrozenDict({k: _freeze(i) for k, i in v.items()})
+				# a FrozenDict only blocks writes to its own keys, so its values are
+				# frozen too; one whose values were already frozen is kept as-is
+				if type(v) is FrozenDict and all(out[k] is i for k, i in v.items()):
+					out = v
+			elif _isinstance(v, _list):
+				out = tuple(_freeze(i) for i in v)
+			elif _isinstance(v, _set):
+				out = frozenset(_freeze(i) for i in v)
+			else:
 				return v
-			if isinstance(v, dict):
-				return FrozenDict({k: _freeze(i) for k, i in v.items()})
-			if isinstance(v, list):
-				return tuple(_freeze(i) for i in v)
-			if isinstance(v, set):
-				return frozenset(_freeze(i) for i in v)
-			return v
+			# keep the original alive so its id cannot be reused mid-walk
+			_seen[id(v)] = (v, out)
+			return out
 		
-		if not self.__frozen:
-			for k, v in list(self.__dict__.items()):
-				if k.startswith("_Data__"):
-					continue
-				if k in self.__anti_freeze_fields:
-					continue
-				
-				try:
-					super().__setattr__(k, _freeze(v))
-				except Exception as e:
-					tb = traceback.format_exc()
-					raise DataError(
-						f"Error freezing key '{k}': {e}\n{tb}"
-					) from e
+		d = self.__dict__
+		anti = self.__anti_freeze_fields
+		non_fields = self.__non_fields
+		for k, v in d.items():
+			if k in anti or k in non_fields:
+				continue
 			
-			super().__setattr__("_Data__hash", None)
-			super().__setattr__("_Data__frozen", True)
+			try:
+				d[k] = _freeze(v)
+			except Exception as e:
+				raise DataError(f"Error freezing key '{k}': {e}") from e
+		
+		# tuples and FrozenDicts are kept as-is above, so they may still hold
+		# mutable values; only a fully immutable tree may be shared by copies
+		deep = not anti and all(
+			_deeply_immutable(v) for k, v in d.items() if k not in non_fields
+		)
+		super().__setattr__("_Data__deep_frozen", deep)
+		super().__setattr__("_Data__hash", None)
+		super().__setattr__("_Data__frozen", True)
 		
 		return self
 	
 	@contextmanager
 	def transaction(self) -> Generator[None, None, None]:
 		"""
-		A context manager that snapshots state and rolls back if an exception occurs.
+		A context manager that journals writes and rolls them back if an exception occurs.
+		
+		Only the keys assigned inside the block are recorded (their previous value is
+		saved on first write), so entering a transaction does not copy any state.
+		In-place mutations of contained objects (e.g. list.append) are not tracked.
 		
 		Raises:
-			TransactionError: If the snapshot or rollback process fails.
+			TransactionError: If the rollback process fails.
 		"""
-		try:
-			snapshot = {
-				k: copy.deepcopy(v)
-				for k, v in self.__dict__.items()
-				if not k.startswith("_Data__")
-			}
-		except Exception as e:
-			tb = traceback.format_exc()
-			print("Failed to snapshot state for transaction")
-			raise TransactionError(f"Failed to snapshot state: {e}\n{tb}") from e
-		
-		self.__transaction_stack.append(snapshot)
+		stack = self.__transaction_stack
+		journal: Dict[str, Any] = {}
+		stack.append(journal)
 		try:
 			yield
-			# commit: pop snapshot
-			self.__transaction_stack.pop()
 		except Exception as e:
 			# rollback
 			try:
-				state = self.__transaction_stack.pop()
+				d = self.__dict__
 				
-				for k in list(self.__dict__.keys()):
-					if not k.startswith("_Data__"):
-						del self.__dict__[k]
-				for k, v in state.items():
-					if not k.startswith("_Data__"):
-						self.__dict__[k] = v
+				for k, v in journal.items():
+					if v is _MISSING:
+						d.pop(k, None)
+					elif type(v) is _Registration:
+						self._reattach(k, v.value)
+					else:
+						d[k] = v
 				
-				print(f"Transaction failed and was rolled back due to: {e}")
+				if journal:
+					if not self.__frozen:
+						super().__setattr__("_Data__hash", None)
+					if self.__computed_lazy:
+						self._invalidate_lazy()
+				
+				_logger.debug("Transaction rolled back due to: %r", e)
 			except Exception as inner:
-				tb = traceback.format_exc()
-				print("Rollback failed")
-				raise TransactionError(f"Rollback failed: {inner}\n{tb}") from inner
+				raise TransactionError(f"Rollback failed: {inner}") from inner
 			# re-raise original error for caller to handle
 			raise
+		else:
+			# commit: hand the journal to the enclosing transaction, if any
+			if len(stack) > 1:
+				parent = stack[-2]
+				for k, v in journal.items():
+					parent.setdefault(k, v)
+		finally:
+			# popped on every exit (KeyboardInterrupt included), so no later write
+			# can journal into a transaction that has already ended
+			stack.pop()
+	
+	@contextmanager
+	def batch_updates(self) -> Generator[None, None, None]:
+		"""
+		A context manager that defers lazy invalidation and watcher notification.
+		
+		Writes inside the block are applied immediately, but lazy fields are
+		invalidated once and watchers are notified once per changed key, with the
+		value from before the block and the final value, when the outermost block
+		exits. Lazy fields read inside the block may still reflect earlier values.
+		"""
+		super().__setattr__("_Data__batch_depth", self.__batch_depth + 1)
+		try:
+			yield
+		finally:
+			depth = self.__batch_depth - 1
+			super().__setattr__("_Data__batch_depth", depth)
+			if not depth:
+				self._flush_pending()
+	
+	def _flush_pending(self) -> None:
+		"""Internal helper to apply the invalidation and notifications deferred by batch_updates()."""
+		pending = self.__pending_changes
+		if not pending:
+			return
+		super().__setattr__("_Data__pending_changes", {})
+		
+		if self.__computed_lazy:
+			self._invalidate_lazy()
+		if self.__watchers:
+			d = self.__dict__
+			for k, old in pending.items():
+				new = d.get(k)
+				# written back to where it started (or rolled back): nothing changed
+				if new is old or (type(new) is type(old) and type(new) in _SCALAR_TYPES and new == old):
+					continue
+				self._notify(k, old, new)
 	
 	# 4. Observation & Sync
 	
@@ -604,16 +1050,17 @@ class Data:
 		"""
 		if not callable(fn):
 			raise TypeError("watch() expects a callable")
-		self.__watchers.append(fn)
+		# immutable tuple: a notification in progress keeps iterating the old one
+		super().__setattr__("_Data__watchers", self.__watchers + (fn,))
 	
 	def _notify(self, key: str, old: Any, new: Any) -> None:
 		"""Internal helper to notify all watchers of a change."""
-		for w in list(self.__watchers):
+		for w in self.__watchers:
 			try:
 				w(key, old, new)
 			except Exception:
 				# watcher must not break core logic; log and continue
-				print(f"Watcher raised for key {key}")
+				_logger.exception("Watcher raised for key %r", key)
 	
 	def diff(self, other: "Data") -> Dict[str, Tuple[Any, Any]]:
 		"""
@@ -628,14 +1075,28 @@ class Data:
 		if not isinstance(other, Data):
 			raise TypeError("diff() expects another Data instance")
 		out: Dict[str, Tuple[Any, Any]] = {}
-		keys = set(self.__dict__) | set(other.__dict__)
-		for k in keys:
-			if k.startswith("_Data__"):
+		sa = self.__dict__
+		sb = other.__dict__
+		# bound Methods and cached Lazy values sit in __dict__ but are not fields
+		la = self.__non_fields
+		lb = other.__non_fields
+		
+		# a missing key compares as None, as with dict.get
+		for k, a in sa.items():
+			if k in la:
+				continue
+			b = sb.get(k) if k not in lb else None
+			# identity first: shared (e.g. frozen) subtrees skip deep equality
+			if a is b:
 				continue
-			a = self.__dict__.get(k)
-			b = other.__dict__.get(k)
 			if a != b:
 				out[k] = (b, a)
+		# membership probes instead of a keys-view difference: no temporary set
+		for k, b in sb.items():
+			if k in lb or (k in sa and k not in la):
+				continue
+			if b is not None:
+				out[k] = (b, None)
 		return out
 	
 	def apply(self, patch: Dict[str, Tuple[Any, Any]]) -> None:
@@ -656,69 +1117,133 @@ class Data:
 	
 	# 5. Utilities & Dunders
 	
-	def to_dict(self, _memo: Optional[Set[int]] = None, *, for_hash: bool = False) -> Dict[str, Any]:
+	def to_dict(self, for_hash: bool = False) -> Dict[str, Any]:
 		"""
 		Recursively converts the Data object into a standard Python dictionary.
 		
+		A Data reached again while it is still being converted (a reference
+		cycle) is emitted as {"$circular": True}.
+		
 		Args:
-			_memo: Internal set for circular reference detection.
 			for_hash: If True, excludes AntiFreeze and Lazy fields to ensure stable hashing.
 		
 		Returns:
 			A dictionary representation of the Data instance.
 		"""
+		# flat record: nothing to recurse into and no cycle possible
+		if not self.__has_containers:
+			non_fields = self.__non_fields
+			anti = self.__anti_freeze_fields if for_hash else ()
+			if not non_fields and not anti:
+				return dict(self.__dict__)
+			return {k: v for k, v in self.__dict__.items() if k not in non_fields and k not in anti}
+		
+		# set only while this node is on the conversion stack
+		if self.__visiting:
+			return {"$circular": True}
+		object.__setattr__(self, "_Data__visiting", True)
 		try:
-			if _memo is None:
-				_memo = set()
-			if id(self) in _memo:
-				return {"$circular": True}
-			_memo.add(id(self))
-			
+			d = self.__dict__
+			get_handler = _TO_DICT_DISPATCH.get
+			fallback = _to_dict_fallback
+			anti = self.__anti_freeze_fields
+			non_fields = self.__non_fields
 			out: Dict[str, Any] = {}
-			for k, v in self.__dict__.items():
-				if k.startswith("_Data__"):
+			for k, v in d.items():
+				if k in non_fields or (for_hash and k in anti):
 					continue
-				if for_hash:
-					if k in self.__anti_freeze_fields:
-						continue
-					if k in self.__lazy_fields:
-						continue
 				
-				if isinstance(v, Data):
-					out[k] = v.to_dict(_memo, for_hash=for_hash)
-				elif isinstance(v, dict):
-					out[k] = {
-						kk: vv.to_dict(_memo, for_hash=for_hash)
-						if isinstance(vv, Data) else vv
-						for kk, vv in v.items()
-					}
-				elif isinstance(v, (list, tuple, set)):
-					out[k] = [
-						i.to_dict(_memo, for_hash=for_hash)
-						if isinstance(i, Data) else i
-						for i in v
-					]
-				else:
-					out[k] = v
+				out[k] = get_handler(type(v), fallback)(v, for_hash)
 			
 			return out
 		except Exception as e:
-			tb = traceback.format_exc()
-			raise SerializationError(f"to_dict failed: {e}\n{tb}") from e
+			raise SerializationError(f"to_dict failed: {e}") from e
+		finally:
+			object.__setattr__(self, "_Data__visiting", False)
+	
+	def __deepcopy__(self, memo: Dict[int, Any]) -> "Data":
+		"""
+		Deep-copies the instance.
+		
+		Frozen Data with nothing mutable at any depth (no AntiFreeze fields, here or
+		in nested values) is shared instead of copied; only mutable branches of a
+		tree are duplicated. The copy does not inherit any open transaction.
+		"""
+		if self.__deep_frozen:
+			return self
+		
+		# open transactions and batches stay with the original: those slots keep
+		# their _bare() defaults
+		new = type(self)._bare()
+		memo[id(self)] = new
+		setslot = object.__setattr__
+		# Method/Lazy descriptors are stateless, so the tables are copied shallowly
+		setslot(new, "_Data__frozen", self.__frozen)
+		setslot(new, "_Data__watchers", self.__watchers)
+		new.__lazy_fields.update(self.__lazy_fields)
+		new.__computed_lazy.update(self.__computed_lazy)
+		new.__anti_freeze_fields.update(self.__anti_freeze_fields)
+		new.__methods.update(self.__methods)
+		new.__non_fields.update(self.__non_fields)
+		setslot(new, "_Data__hash", self.__hash)
+		setslot(new, "_Data__has_containers", self.__has_containers)
+		
+		nd = new.__dict__
+		methods = self.__methods
+		for k, v in self.__dict__.items():
+			if k in methods:
+				# bound closures reference this instance; the copy binds its own
+				nd[k] = methods[k].bind(new, k)
+			else:
+				nd[k] = _clone_value(v, memo)
+		return new
+	
+	def __getstate__(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+		"""
+		Returns (fields, internal slots) for copy.copy and pickle.
+		
+		Bound Methods and cached Lazy values are left out: the closures reference
+		this instance (and cannot be pickled), so __setstate__ rebinds Methods to
+		the new instance and Lazy values are recomputed on first access.
+		"""
+		non_fields = self.__non_fields
+		fields = {k: v for k, v in self.__dict__.items() if k not in non_fields}
+		slots = {k: getattr(self, k) for k in _INTERNAL_KEYS if k not in _TRANSIENT_KEYS}
+		return fields, slots
+	
+	def __setstate__(self, state: Tuple[Dict[str, Any], Dict[str, Any]]) -> None:
+		"""
+		Restores state produced by __getstate__ (copy.copy, pickle).
+		
+		Internal containers are copied, so a shallow copy never shares lazy caches,
+		tables or transaction state with its source; like __deepcopy__, the copy
+		starts with no open transaction or batch.
+		"""
+		fields, slots = state
+		self._init_state()
+		setslot = object.__setattr__
+		for k, v in slots.items():
+			setslot(self, k, v.copy() if type(v) in (dict, set) else v)
+		d = self.__dict__
+		d.update(fields)
+		for k, m in self.__methods.items():
+			d[k] = m.bind(self, k)
 	
 	def snapshot(self) -> "Data":
 		"""
 		Creates a deep copy of the current Data instance.
 		
+		Frozen Data that is immutable at every depth is not copied: the snapshot is
+		the instance itself, and so are such subtrees inside a copied tree. Watchers
+		registered on a shared instance therefore apply to the original.
+		
 		Returns:
-			A new Data instance with identical data.
+			A Data instance with identical data (self if deeply frozen).
 		"""
 		try:
-			return copy.deepcopy(self)
+			return _clone_value(self, {})
 		except Exception as e:
-			tb = traceback.format_exc()
-			print("Snapshot failed")
-			raise DataError(f"Snapshot failed: {e}\n{tb}") from e
+			raise DataError(f"Snapshot failed: {e}") from e
 	
 	def view(self, mapping: Dict[str, Callable[["Data"], Any]]) -> View:
 		"""
@@ -745,30 +1270,56 @@ class Data:
 		if not self.__frozen or not other.__frozen:
 			return False
 		
+		# equal Data hash equal, so differing cached hashes settle it without a walk
+		h1 = self.__hash
+		h2 = other.__hash
+		if h1 is not None and h2 is not None and h1 != h2:
+			return False
+		
 		try:
 			return self.to_dict(for_hash=True) == other.to_dict(for_hash=True)
 		except Exception:
 			return False
 	
+	def __hash_fields(self, memo: Set[int]) -> int:
+		"""
+		Folds the hashable fields (no AntiFreeze/Lazy) into a single structural hash.
+		
+		memo holds the Data currently on the walk stack, as __visiting does for
+		to_dict: only a real cycle folds as _CIRCULAR_HASH, while a subtree shared
+		by several branches hashes the same at each of them (as __eq__ sees it).
+		"""
+		if id(self) in memo:
+			return _CIRCULAR_HASH
+		memo.add(id(self))
+		try:
+			anti = self.__anti_freeze_fields
+			non_fields = self.__non_fields
+			scalars = _SCALAR_TYPES
+			pairs = []
+			for k, v in self.__dict__.items():
+				if k in anti or k in non_fields:
+					continue
+				pairs.append((k, hash(v) if type(v) in scalars else _hash_value(v, memo)))
+			return hash(frozenset(pairs))
+		finally:
+			memo.discard(id(self))
+	
 	def __hash__(self) -> int:
-		"""Computes a hash based on serialized data. Requires the object to be frozen."""
+		"""Computes a structural hash of the data. Requires the object to be frozen."""
 		if not self.__frozen:
 			raise TypeError("Unfrozen Data is unhashable")
 		
-		h = getattr(self, "_Data__hash", None)
+		h = self.__hash
 		if h is not None:
 			return h
 		
 		try:
-			h = hash(json.dumps(
-				self.to_dict(for_hash=True),
-				sort_keys=True
-			))
+			h = self.__hash_fields(set())
 			super().__setattr__("_Data__hash", h)
 			return h
 		except Exception as e:
-			tb = traceback.format_exc()
-			raise SerializationError(f"Hashing failed: {e}\n{tb}") from e
+			raise SerializationError(f"Hashing failed: {e}") from e
 	
 	def __repr__(self) -> str:
 		try:
@@ -776,5 +1327,188 @@ class Data:
 		except SerializationError:
 			return f"<Data (unserializable) at {hex(id(self))}>"
 
+# to_dict handlers, dispatched on the exact type of each field value
+
+def _to_dict_leaf(v: Any, for_hash: bool) -> Any:
+	return v
+
+def _to_dict_mapping(v: Dict[Any, Any], for_hash: bool) -> Dict[Any, Any]:
+	return {
+		kk: vv.to_dict(for_hash=for_hash)
+		if isinstance(vv, Data) else vv
+		for kk, vv in v.items()
+	}
+
+def _to_dict_sequence(v: Any, for_hash: bool) -> List[Any]:
+	return [
+		i.to_dict(for_hash=for_hash)
+		if isinstance(i, Data) else i
+		for i in v
+	]
+
+def _to_dict_fallback(v: Any, for_hash: bool) -> Any:
+	"""Handles subclasses and unknown types with the isinstance ladder."""
+	if isinstance(v, Data):
+		return v.to_dict(for_hash)
+	if isinstance(v, dict):
+		return _to_dict_mapping(v, for_hash)
+	if isinstance(v, (list, tuple, set)):
+		return _to_dict_sequence(v, for_hash)
+	return v
+
+_TO_DICT_DISPATCH: Dict[type, Callable[[Any, bool], Any]] = {
+	int: _to_dict_leaf,
+	float: _to_dict_leaf,
+	str: _to_dict_leaf,
+	bool: _to_dict_leaf,
+	type(None): _to_dict_leaf,
+	# called directly: no wrapper frame per nested Data
+	Data: Data.to_dict,
+	dict: _to_dict_mapping,
+	FrozenDict: _to_dict_mapping,
+	list: _to_dict_sequence,
+	tuple: _to_dict_sequence,
+	set: _to_dict_sequence,
+}
+
+# __hash__ handlers; equal values (as compared by __eq__) must hash equal,
+# so Data and mappings fold the same way and lists hash like tuples
+
+_CIRCULAR_HASH = hash("$circular")
+
+def _hash_leaf(v: Any, memo: Set[int]) -> int:
+	return hash(v)
+
+def _hash_data(v: Data, memo: Set[int]) -> int:
+	h = v._Data__hash
+	if h is not None:
+		return h
+	return v._Data__hash_fields(memo)
+
+def _hash_frozendict(v: FrozenDict, memo: Set[int]) -> int:
+	# reuse a cached hash, but never cache one computed mid-walk (cycles)
+	try:
+		return v._FrozenDict__hash
+	except AttributeError:
+		return _hash_mapping(v, memo)
+
+# scalar leaves are hashed inline, skipping the dispatch call
+
+def _hash_mapping(v: Dict[Any, Any], memo: Set[int]) -> int:
+	scalars = _SCALAR_TYPES
+	return hash(frozenset(
+		(k, hash(x) if type(x) in scalars else _hash_value(x, memo))
+		for k, x in v.items()
+	))
+
+def _hash_sequence(v: Any, memo: Set[int]) -> int:
+	scalars = _SCALAR_TYPES
+	# every item folds in as its hash, as the other handlers return, so an
+	# all-scalar (e.g. numeric) sequence is hashed entirely in C with the same result
+	if scalars.issuperset(map(type, v)):
+		return hash(tuple(map(hash, v)))
+	return hash(tuple(
+		hash(i) if type(i) in scalars else _hash_value(i, memo)
+		for i in v
+	))
+
+def _hash_fallback(v: Any, memo: Set[int]) -> int:
+	"""Handles subclasses and unknown types with an isinstance ladder."""
+	if isinstance(v, Data):
+		return _hash_data(v, memo)
+	if isinstance(v, dict):
+		return _hash_mapping(v, memo)
+	if isinstance(v, (list, tuple)):
+		return _hash_sequence(v, memo)
+	if isinstance(v, set):
+		return hash(frozenset(v))
+	return hash(v)
+
+def _hash_value(v: Any, memo: Set[int]) -> int:
+	return _HASH_DISPATCH.get(type(v), _hash_fallback)(v, memo)
+
+_HASH_DISPATCH: Dict[type, Callable[[Any, Set[int]], int]] = {
+	int: _hash_leaf,
+	float: _hash_leaf,
+	str: _hash_leaf,
+	bool: _hash_leaf,
+	bytes: _hash_leaf,
+	type(None): _hash_leaf,
+	frozenset: _hash_leaf,
+	Data: _hash_data,
+	dict: _hash_mapping,
+	FrozenDict: _hash_frozendict,
+	list: _hash_sequence,
+	tuple: _hash_sequence,
+}
+
+# deep-copy handlers for snapshot/__deepcopy__; plain-data types are walked
+# directly and anything else goes through copy.deepcopy with the same memo
+
+def _clone_dict(v: Dict[Any, Any], memo: Dict[int, Any]) -> Dict[Any, Any]:
+	new: Dict[Any, Any] = {}
+	memo[id(v)] = new
+	for k, x in v.items():
+		new[k] = _clone_value(x, memo)
+	return new
+
+def _clone_list(v: List[Any], memo: Dict[int, Any]) -> List[Any]:
+	new: List[Any] = []
+	memo[id(v)] = new
+	new.extend([_clone_value(x, memo) for x in v])
+	return new
+
+def _clone_set(v: Set[Any], memo: Dict[int, Any]) -> Set[Any]:
+	new: Set[Any] = set()
+	memo[id(v)] = new
+	new.update([_clone_value(x, memo) for x in v])
+	return new
+
+def _clone_tuple(v: Tuple[Any, ...], memo: Dict[int, Any]) -> Tuple[Any, ...]:
+	items = [_clone_value(x, memo) for x in v]
+	# a tuple reached again through its own items was already copied there
+	if id(v) in memo:
+		return memo[id(v)]
+	# nothing inside changed: share the original, as copy.deepcopy does
+	for x, y in zip(v, items):
+		if x is not y:
+			new = memo[id(v)] = tuple(items)
+			return new
+	return v
+
+def _clone_value(v: Any, memo: Dict[int, Any]) -> Any:
+	t = type(v)
+	if t in _SCALAR_TYPES:
+		return v
+	new = memo.get(id(v), _MISSING)
+	if new is not _MISSING:
+		return new
+	return _CLONE_DISPATCH.get(t, copy.deepcopy)(v, memo)
+
+_CLONE_DISPATCH: Dict[type, Callable[[Any, Dict[int, Any]], Any]] = {
+	Data: Data.__deepcopy__,
+	FrozenDict: FrozenDict.__deepcopy__,
+	dict: _clone_dict,
+	list: _clone_list,
+	set: _clone_set,
+	tuple: _clone_tuple,
+}
+
+# mangled names of Data's internal slots, derived so the two never drift apart
+_INTERNAL_KEYS = frozenset(
+	f"_Data{name}" for name in Data.__slots__
+	if name.startswith("__") and not name.endswith("__")
+)
+
+# slots a copy never inherits (they keep their _init_state defaults): per-operation
+# state, and the cached-Lazy set, since cached values are not copied
+_TRANSIENT_KEYS = frozenset({
+	"_Data__computed_lazy",
+	"_Data__transaction_stack",
+	"_Data__visiting",
+	"_Data__batch_depth",
+	"_Data__pending_changes",
+})
+
 __all__ = ('Data', 'FrozenDict', 'AntiFreeze', 'Method', 'Computed', 'Lazy', 'View')
 __version__ = "2.2.0"
\ No newline at end of file